@@ -13,6 +13,8 @@ from shiny import App, ui, render, reactive
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from eln_search import build_search_index, search_frame
+
 # -------------------------------------------------------------------
 # Daten laden
 # -------------------------------------------------------------------
@@ -35,6 +37,13 @@ def make_choices(series: pd.Series):
     vals = sorted(x for x in series.dropna().unique())
     return ["All"] + vals
 
+# -------------------------------------------------------------------
+# Volltextsuche über raw_eln_text (invertierter Index)
+# -------------------------------------------------------------------
+
+# Index wird einmal beim Laden aufgebaut (siehe eln_search.py)
+search_index = build_search_index(df)
+
 protein_choices = make_choices(df["protein"])
 host_choices = make_choices(df["host"])
 medium_choices = make_choices(df["medium"])
@@ -50,6 +59,11 @@ app_ui = ui.page_navbar(
         ui.layout_sidebar(
             ui.sidebar(
                 ui.h4("Filter"),
+                ui.input_text(
+                    "search_query",
+                    "Volltextsuche (ELN-Text, Begriffe mit Komma = UND)",
+                    placeholder="z.B. Aggregation, Superdex 75, BugBuster",
+                ),
                 ui.input_select(
                     "protein_filter",
                     "Protein",
@@ -133,10 +147,10 @@ app_ui = ui.page_navbar(
 # -------------------------------------------------------------------
 
 def server(input, output, session):
-    # Reaktiver Filter auf Basis der Dropdowns
+    # Reaktiver Filter auf Basis der Volltextsuche und der Dropdowns
     @reactive.calc
     def filtered_df():
-        d = df.copy()
+        d = search_frame(df, search_index, input.search_query())
 
         pf = input.protein_filter()
         if pf != "All":
@@ -0,0 +1,231 @@
+# eln_search.py
+#
+# Volltextsuche über die rohen ELN-Texte (raw_eln_text)
+#
+# - Invertierter Index Token -> Posting-Liste (Menge von Zeilen-Indizes)
+# - Deutsch/Englisch-Tokenisierung (Umlaute, Akzente, Dezimalzahlen)
+# - Suchanfrage: Begriffe mit Komma/Semikolon trennen (= UND),
+#   Wörter innerhalb eines Begriffs müssen direkt aufeinander folgen
+#   ("Superdex 75"), das letzte Wort eines Begriffs wird als Präfix gesucht
+#   (Zahlen immer exakt)
+#
+# Bewusst ohne pandas/shiny-Import, damit das Modul einzeln testbar ist.
+
+import re
+import unicodedata
+from bisect import bisect_left, insort
+
+# Dezimalzahlen bleiben ein Token ("0.5"), sonst Wort-Zeichen inkl.
+# Umlaute; Bindestriche trennen Tokens ("His6-CASPON" -> "his6", "caspon")
+TOKEN_RE = re.compile(r"\d+(?:\.\d+)?|\w+")
+
+# Zahlen mit Kommas; nur genau ein Komma gilt als Dezimalkomma ("1,5" -> "1.5"),
+# längere Folgen sind Listen ("Fraktionen 5,6,7") und bleiben getrennt
+DECIMAL_COMMA_RE = re.compile(r"\d+(?:,\d+)+")
+
+# Begriffe in der Suchanfrage trennen; Komma zwischen Ziffern ist ein Dezimalkomma
+CLAUSE_SPLIT_RE = re.compile(r";|,(?!\d)|(?<!\d),")
+
+# Deutsche Sonderzeichen so falten, dass "Lösung" und "Loesung"
+# bei der Suche gleich behandelt werden
+UMLAUT_MAP = [("ä", "ae"), ("ö", "oe"), ("ü", "ue"), ("ß", "ss")]
+
+# Kombinierende diakritische Zeichen (nach NFKD-Zerlegung)
+COMBINING_RE = re.compile("[\u0300-\u036f]")
+
+# Kürzere letzte Wörter werden exakt statt als Präfix gesucht. Sonst würde
+# schon der erste getippte Buchstabe über fast das ganze Vokabular laufen.
+# Zahlen werden immer exakt gesucht ("200" soll nicht "2000" finden).
+MIN_PREFIX_LEN = 3
+
+# Bis zu so vielen neuen Tokens werden einzeln einsortiert, sonst wird neu sortiert
+VOCAB_INSORT_MAX = 256
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalisiert Text für Index und Suche:
+    - casefold (Groß-/Kleinschreibung egal)
+    - NFC, damit auch zerlegte Umlaute ("o" + U+0308, z.B. von macOS) gefaltet werden
+    - Umlaute/ß -> ae/oe/ue/ss
+    - übrige Akzente entfernen (z.B. "é" -> "e")
+    """
+    text = text.casefold()
+    if text.isascii():
+        return text
+    text = unicodedata.normalize("NFC", text)
+    # str.replace ist hier deutlich schneller als str.translate mit dict
+    for src, dst in UMLAUT_MAP:
+        text = text.replace(src, dst)
+    if text.isascii():
+        return text
+    return COMBINING_RE.sub("", unicodedata.normalize("NFKD", text))
+
+
+def _fold_decimal_comma(match) -> str:
+    number = match.group()
+    return number.replace(",", ".") if number.count(",") == 1 else number
+
+
+def tokenize(text) -> list:
+    """Zerlegt einen (deutsch/englischen) ELN-Text in normalisierte Tokens."""
+    if not isinstance(text, str):
+        return []
+    text = normalize_text(text)
+    if "," in text:
+        text = DECIMAL_COMMA_RE.sub(_fold_decimal_comma, text)
+    return TOKEN_RE.findall(text)
+
+
+def parse_query(query) -> list:
+    """Zerlegt eine Suchanfrage in Begriffe (je eine Token-Liste, leere entfallen)."""
+    if not isinstance(query, str):
+        return []
+    clauses = (tokenize(c) for c in CLAUSE_SPLIT_RE.split(query))
+    return [c for c in clauses if c]
+
+
+def is_prefix_term(token: str) -> bool:
+    return len(token) >= MIN_PREFIX_LEN and not token[0].isdigit()
+
+
+class InvertedIndex:
+    """
+    Invertierter Index Token -> Posting-Liste (Menge von DataFrame-Indizes).
+
+    - Wird einmal beim Laden aufgebaut und kann mit add()/remove()
+      inkrementell aktualisiert werden.
+    - Das sortierte Vokabular wird lazy (erst bei der nächsten
+      Präfix-Suche) nachgezogen: wenige neue Tokens werden einsortiert,
+      viele führen zu einem Neu-Sortieren. Tote Tokens bleiben bis zur
+      nächsten Kompaktierung stehen und werden beim Lookup übersprungen.
+    - Pro Dokument wird die Token-Folge als " tok1 tok2 ... " gehalten,
+      für remove() und für die Prüfung, ob Wörter eines Begriffs direkt
+      aufeinander folgen (Substring-Test statt Python-Schleife).
+    """
+
+    def __init__(self):
+        self.postings = {}     # token -> set(doc_id)
+        self.doc_text = {}     # doc_id -> " tok1 tok2 ... " in Textreihenfolge
+        self.vocab = []        # sortierte Tokens (inkl. toter, siehe dead_tokens)
+        self.new_tokens = []   # noch nicht einsortierte Tokens
+        self.dead_tokens = set()  # in vocab, aber ohne Posting-Liste
+
+    def __len__(self):
+        return len(self.doc_text)
+
+    def add(self, doc_id, text):
+        if doc_id in self.doc_text:
+            self.remove(doc_id)
+        tokens = tokenize(text)
+        self.doc_text[doc_id] = " " + " ".join(tokens) + " "
+        for tok in set(tokens):
+            posting = self.postings.get(tok)
+            if posting is not None:
+                posting.add(doc_id)
+                continue
+            self.postings[tok] = {doc_id}
+            if tok in self.dead_tokens:
+                self.dead_tokens.discard(tok)
+            else:
+                self.new_tokens.append(tok)
+
+    def remove(self, doc_id):
+        text = self.doc_text.pop(doc_id, None)
+        if text is None:
+            return
+        for tok in set(text.split()):
+            posting = self.postings[tok]
+            posting.discard(doc_id)
+            if not posting:
+                del self.postings[tok]
+                self.dead_tokens.add(tok)
+
+    def _sort_vocab(self):
+        new = self.new_tokens
+        if len(self.dead_tokens) > len(self.vocab) // 4:
+            self.vocab = sorted(self.postings)
+            self.dead_tokens.clear()
+        elif len(new) > VOCAB_INSORT_MAX:
+            self.vocab.extend(new)
+            self.vocab.sort()
+        else:
+            for tok in new:
+                insort(self.vocab, tok)
+        new.clear()
+
+    def prefix_lookup(self, prefix: str, candidates=None) -> set:
+        """
+        doc_ids mit einem Token, das mit prefix beginnt.
+        Mit candidates wird nur innerhalb dieser Menge gesucht (ohne die
+        volle Vereinigung aller passenden Posting-Listen aufzubauen).
+        """
+        self._sort_vocab()
+        result = set()
+        vocab = self.vocab
+        i = bisect_left(vocab, prefix)
+        while i < len(vocab) and vocab[i].startswith(prefix):
+            posting = self.postings.get(vocab[i])
+            if posting is not None:
+                result |= posting if candidates is None else candidates & posting
+            i += 1
+        return result
+
+    def search(self, query: str):
+        """
+        Liefert die doc_ids, die alle Begriffe der Anfrage enthalten.
+        Gibt None zurück, wenn die Anfrage keine Tokens enthält (= kein Filter).
+        """
+        clauses = parse_query(query)
+        if not clauses:
+            return None
+
+        exact, prefixes = set(), set()
+        for terms in clauses:
+            exact.update(terms[:-1])
+            last = terms[-1]
+            (prefixes if is_prefix_term(last) else exact).add(last)
+
+        # Exakte Tokens: kleinste Posting-Liste zuerst schneiden
+        result = None
+        for posting in sorted((self.postings.get(t, set()) for t in exact), key=len):
+            result = set(posting) if result is None else result & posting
+            if not result:
+                return set()
+
+        # Präfixe nur noch gegen die laufende Treffermenge prüfen
+        for prefix in sorted(prefixes, key=len, reverse=True):
+            result = self.prefix_lookup(prefix, result)
+            if not result:
+                return result
+
+        # Mehrwort-Begriffe: Wörter müssen direkt aufeinander folgen
+        for terms in clauses:
+            if len(terms) > 1:
+                # Letztes Wort als Präfix: kein abschließendes Leerzeichen
+                phrase = " " + " ".join(terms) + ("" if is_prefix_term(terms[-1]) else " ")
+                doc_text = self.doc_text
+                result = {d for d in result if phrase in doc_text[d]}
+                if not result:
+                    break
+        return result
+
+
+def build_search_index(frame, column: str = "raw_eln_text") -> InvertedIndex:
+    """Baut den Index über frame[column]; doc_ids sind die DataFrame-Indizes."""
+    index = InvertedIndex()
+    if column in frame.columns:
+        for doc_id, text in frame[column].items():
+            index.add(doc_id, text)
+    return index
+
+
+def search_frame(frame, index: InvertedIndex, query: str):
+    """
+    Zeilen von frame, die zur Suchanfrage passen (leere Anfrage = alle Zeilen).
+    Das Ergebnis kann danach wie gewohnt weiter gefiltert werden (Dropdowns).
+    """
+    hits = index.search(query)
+    if hits is None:
+        return frame.copy()
+    return frame[frame.index.isin(hits)]
@@ -0,0 +1,210 @@
+# test_eln_search.py
+#
+# Tests für die Volltextsuche (eln_search.py)
+#
+# Start:
+#   python -m pytest -q test_eln_search.py
+
+import math
+import unicodedata
+
+import pytest
+
+from eln_search import InvertedIndex, build_search_index, search_frame, tokenize
+
+
+def make_index(docs):
+    index = InvertedIndex()
+    for doc_id, text in docs.items():
+        index.add(doc_id, text)
+    return index
+
+
+DOCS = {
+    0: "Protein: His6-CASPON-CandidateA\nNotizen: lösliches Protein, kaum Aggregation",
+    1: "Lyse: BugBuster + Lysozym\nBemerkung: deutliche Aggregation",
+    2: "Purification: Ni-NTA, followed by SEC (Superdex 200), 75 mM NaCl",
+    3: "SEC auf Superdex 75, Induktion mit 0,5 mM IPTG",
+}
+
+
+# -------------------------------------------------------------------
+# Tokenisierung
+# -------------------------------------------------------------------
+
+def test_tokenize_folds_case_umlauts_and_accents():
+    assert tokenize("Lösung LOESUNG Straße Café") == ["loesung", "loesung", "strasse", "cafe"]
+
+
+def test_tokenize_folds_decomposed_umlauts():
+    nfd = unicodedata.normalize("NFD", "Lösung")
+    assert nfd != "Lösung"
+    assert tokenize(nfd) == tokenize("Lösung") == ["loesung"]
+
+
+def test_tokenize_keeps_decimal_numbers_together():
+    assert tokenize("IPTG 0.5 mM, 1,5 h") == ["iptg", "0.5", "mm", "1.5", "h"]
+    assert tokenize("His6-CASPON") == ["his6", "caspon"]
+    # Kommagetrennte Listen sind keine Dezimalzahlen
+    assert tokenize("Fraktionen 5,6,7 gepoolt") == ["fraktionen", "5", "6", "7", "gepoolt"]
+
+
+def test_tokenize_non_string():
+    assert tokenize(None) == []
+    assert tokenize(float("nan")) == []
+
+
+# -------------------------------------------------------------------
+# Suche
+# -------------------------------------------------------------------
+
+def test_empty_query_is_no_filter_but_miss_is_empty_set():
+    index = make_index(DOCS)
+    assert index.search("") is None
+    assert index.search("  , ;") is None
+    assert index.search("xyzzy") == set()
+
+
+def test_single_terms():
+    index = make_index(DOCS)
+    assert index.search("Aggregation") == {0, 1}
+    assert index.search("BugBuster") == {1}
+    assert index.search("Lösl") == index.search("loesl") == {0}
+
+
+def test_prefix_only_on_last_word_and_min_length():
+    index = make_index(DOCS)
+    assert index.search("aggreg") == {0, 1}
+    # Zu kurz für Präfix -> exakter Treffer
+    assert index.search("ag") == set()
+    # Nicht-letzte Wörter eines Begriffs müssen exakt passen
+    assert index.search("superd 200") == set()
+
+
+def test_phrase_requires_adjacent_words():
+    index = make_index(DOCS)
+    assert index.search("Superdex 75") == {3}
+    assert index.search("Superdex 200") == {2}
+    assert index.search("superdex 20") == set()
+    assert index.search("superdex 200)") == {2}
+
+
+def test_comma_separated_terms_are_anded():
+    index = make_index(DOCS)
+    assert index.search("Aggregation, BugBuster") == {1}
+    assert index.search("Superdex, NaCl") == {2}
+    assert index.search("Aggregation; Superdex") == set()
+
+
+def test_decimal_comma_in_query():
+    index = make_index(DOCS)
+    assert index.search("0,5 mM") == {3}
+    assert index.search("0.5") == {3}
+    assert index.search("5") == set()
+
+
+def test_numbers_are_matched_exactly():
+    index = make_index({0: "Superdex 2000 gel, IPTG 0,55 mM, Imidazol 2500 mM"})
+    assert index.search("Superdex 200") == set()
+    assert index.search("Superdex 2000") == {0}
+    assert index.search("IPTG 0,5") == set()
+    assert index.search("IPTG 0,55") == {0}
+    assert index.search("Imidazol 250") == set()
+
+
+def test_comma_separated_number_list():
+    index = make_index({0: "Fraktionen 5,6,7 gepoolt"})
+    assert index.search("Fraktionen 5") == {0}
+    assert index.search("6") == {0}
+    assert index.search("5,6,7") == {0}
+
+
+def test_decomposed_query_matches_precomposed_text():
+    index = make_index(DOCS)
+    assert index.search(unicodedata.normalize("NFD", "lösliches")) == {0}
+
+
+def test_add_remove_readd():
+    index = make_index(DOCS)
+    index.remove(1)
+    assert index.search("bugbuster") == set()
+    assert index.search("Aggregation") == {0}
+    assert "bugbuster" not in index.postings
+
+    index.add(1, "BugBuster neu")
+    assert index.search("bugb") == {1}
+
+    # Erneutes add() ersetzt den alten Text
+    index.add(1, "French Press")
+    assert index.search("bugbuster") == set()
+    assert index.search("french press") == {1}
+    assert len(index) == len(DOCS)
+
+
+def test_remove_unknown_doc_is_noop():
+    index = make_index(DOCS)
+    index.remove(42)
+    assert len(index) == len(DOCS)
+
+
+def test_prefix_search_skips_removed_tokens_and_finds_readded():
+    index = make_index(DOCS)
+    assert index.search("bugb") == {1}
+    index.remove(1)
+    assert index.search("bugb") == set()
+    index.add(7, "BugBuster again")
+    assert index.search("bugb") == {7}
+    assert index.search("agai") == {7}
+
+
+
+# -------------------------------------------------------------------
+# DataFrame-Anbindung (wie im Dashboard)
+# -------------------------------------------------------------------
+
+def make_frame():
+    pd = pytest.importorskip("pandas")
+    return pd.DataFrame(
+        {
+            "protein": ["CandidateA", "CandidateB", "CandidateA", "CandidateA"],
+            "raw_eln_text": [
+                "Ni-NTA, kaum Aggregation",
+                "BugBuster, deutliche Aggregation",
+                math.nan,
+                "SEC auf Superdex 75, Aggregation im Void",
+            ],
+        },
+        index=[10, 20, 30, 40],
+    )
+
+
+def test_build_search_index_uses_frame_index_and_skips_nan():
+    index = build_search_index(make_frame())
+    assert len(index) == 4
+    assert index.search("Aggregation") == {10, 20, 40}
+    assert index.search("superdex 75") == {40}
+
+
+def test_build_search_index_without_text_column():
+    frame = make_frame().drop(columns="raw_eln_text")
+    index = build_search_index(frame)
+    assert len(index) == 0
+    assert index.search("Aggregation") == set()
+
+
+def test_search_frame_combined_with_dropdown_filter():
+    frame = make_frame()
+    index = build_search_index(frame)
+
+    # Leere Suche: alle Zeilen (Kopie)
+    d = search_frame(frame, index, "")
+    assert list(d.index) == [10, 20, 30, 40]
+    assert d is not frame
+
+    # Suche, danach Protein-Filter wie in filtered_df()
+    d = search_frame(frame, index, "Aggregation")
+    assert list(d.index) == [10, 20, 40]
+    d = d[d["protein"] == "CandidateA"]
+    assert list(d.index) == [10, 40]
+
+    assert search_frame(frame, index, "xyzzy").empty